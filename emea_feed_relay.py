@@ -15,21 +15,34 @@ London RSOC News Monitor — EMEA-focused RSS relay (v2.7, EN-only, strict EMEA
 from __future__ import annotations
 
 import argparse
+import calendar
+import email.utils
+import gzip
 import hashlib
+import heapq
 import html
+import io
 import json
+import math
 import os
 import re
 import time
+import urllib.error
 import urllib.request
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from difflib import SequenceMatcher
-from typing import Iterable, List, Tuple
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from urllib.parse import urlparse
+from xml.sax.saxutils import escape as xml_escape
 
 import feedparser
-from feedgen.feed import FeedGenerator
+# Private API, checked against feedparser 6.0.x; the workflow pins feedparser<7
+# so a rename can't break the import and leave the published feed stale
+from feedparser.sanitizer import _sanitize_html
 
 # ------------------------------
 # Config: Sources (EN-only)
@@ -80,6 +93,26 @@ ALL_FEEDS += [("meteoalarm", u) for u in MA_FEEDS]
 ALL_FEEDS += [("alerts", u) for u in ALERT_FEEDS]
 ALL_FEEDS += [("news", u) for u in NEWS_FEEDS]
 
+# Feeds are fetched concurrently (network-bound); results keep ALL_FEEDS order
+FETCH_WORKERS = 8
+
+# Conditional-GET cache: per-URL ETag/Last-Modified plus the last good entries,
+# replayed on HTTP 304 so unchanged feeds still contribute to the rebuilt output
+FEED_CACHE_PATH = ".feedcache.json"
+
+# Verdict cache: gates + base score (recency excluded) per entry, keyed by a
+# digest of kind/source/link/text. Reused while this file is unchanged and
+# pruned to the entries seen in the latest run
+SCORE_CACHE_PATH = ".scorecache.json"
+
+# Well-formed RSS 2.0 / RSS 1.0 (RDF) / Atom 1.0 is stream-parsed directly;
+# anything else (malformed XML, exotic dialects) falls back to feedparser
+FETCH_USER_AGENT = "Mozilla/5.0 (compatible; emea-feed-relay)"
+# Per-socket-operation timeout (s) and body cap, so one stalled or bloated
+# feed cannot hold up the whole run
+FETCH_TIMEOUT = 10
+MAX_FEED_BYTES = 2_000_000
+
 # ------------------------------
 # Config: Scoring & GEO (internal/hidden)
 # ------------------------------
@@ -122,20 +155,20 @@ FIN_SECURITY_EXCEPTIONS = [
 ]
 
 # Core incident lexicon
-VIOLENCE = [r"riot|violent|clashes|looting|molotov|stabbing|knife attack|stabbing attack|shooting|gunfire|shots fired|arson"]
+VIOLENCE = [r"riot|violent|clashes|looting|molotov|stabbing|knife attack|shooting|gunfire|shots fired|arson"]
 TERROR_ATTACK = [r"terror(?!ism\s*threat)|car bomb|suicide bomb|ied|explosion|blast"]
 CASUALTIES = [r"\b(dead|deaths|fatalit|injured|wounded|casualt)\b"]
 PROTEST_STRIKE = [r"protest|demonstration|march|blockade|strike|walkout|picket"]
 CYBER = [r"ransomware|data breach|ddos|phishing|malware|cyber attack|hack(?!ney)"]
 TRANSPORT_HARD = [
-    r"airport closed|airspace closed|runway closed|rail suspended|service suspended|port closed|all lanes closed|carriageway closed|road closed|blocked|drone.*(airport|airspace)"
+    r"airspace closed|runway closed|rail suspended|service suspended|port closed|all lanes closed|carriageway closed|road closed|blocked|drone.*(airport|airspace)"
 ]
-TRANSPORT_SOFT = [r"closure|cancel(l|)ed|cancellation|diverted|delay|disruption|grounded|air traffic control"]
+TRANSPORT_SOFT = [r"closure|cancell?ed|cancellation|diverted|delay|disruption|grounded|air traffic control"]
 
 METEO_RED = [r"\bred\b", r"\bsevere\b", r"\bextreme\b"]
 METEO_ORANGE = [r"\borange\b", r"amber"]
 METEO_YELLOW = [r"\byellow\b"]
-HAZARDS = [r"flood|flash flood|earthquake|aftershock|landslide|wildfire|bushfire|storm|hurricane|typhoon|tornado|heatwave|snow|ice|avalanche|wind|gale"]
+HAZARDS = [r"flood|earthquake|aftershock|landslide|wildfire|bushfire|storm|hurricane|typhoon|tornado|heatwave|snow|ice|avalanche|wind|gale"]
 
 # Protest scale / enforcement / government measures / evacuation
 PROTEST_SCALE = [
@@ -147,7 +180,7 @@ PROTEST_SCALE = [
 ]
 ENFORCEMENT = [r"riot police|tear gas|water cannon|baton|clashes with police|arrests?|detained|detentions?"]
 GOV_MEASURES = [r"curfew|state of emergency|martial law|emergency decree|security alert raised"]
-EVACUATION = [r"evacuated|evacuation|terminal evacuated|station evacuated|building evacuated"]
+EVACUATION = [r"evacuated|evacuation"]
 
 # Watchlist cities & hubs
 WATCHLIST = [
@@ -216,6 +249,7 @@ EMEA_TLDS = (
     ".me", ".al", ".mk", ".lt", ".lv", ".ee", ".ua", ".md", ".tr", ".cy", ".il", ".ps", ".lb", ".sy",
     ".jo", ".eg", ".ma", ".dz", ".tn", ".ly", ".sa", ".qa", ".ae", ".kw", ".bh", ".om", ".ye",
 )
+EMEA_TLD_LABELS = frozenset(tld.lstrip(".") for tld in EMEA_TLDS)
 GEO_STRICT = True
 
 # Thresholds
@@ -224,6 +258,10 @@ P2_THRESHOLD = 50
 P3_THRESHOLD = 30
 MIN_SCORE_TO_INCLUDE = 25
 REQUIRE_METEO_ORANGE = True
+# Normalised titles at least this similar (SequenceMatcher ratio) are duplicates
+TITLE_DUP_RATIO = 0.96
+# Public <description> length; summaries are cut to this once scored
+MAX_DESCRIPTION_CHARS = 2000
 
 URGENT_TERMS = [r"explosion|mass casualty|airport closed|airspace closed|terror attack|multiple fatalities"]
 PUBLIC_LABELS = False  # (kept for API compatibility; not used in public titles)
@@ -231,8 +269,86 @@ PUBLIC_LABELS = False  # (kept for API compatibility; not used in public titles)
 # ------------------------------
 # Helpers / Regex compiles
 # ------------------------------
-def _compile(patterns: Iterable[str]) -> List[re.Pattern]:
-    return [re.compile(p, re.I) for p in patterns]
+_REGEX_META = set(".^$*+?{}[]\\|()")
+
+def _scan_top_level(p: str) -> Tuple[List[str], bool]:
+    # Split on top-level '|' (skipping nested groups, classes and escapes); also report
+    # whether the first '(' only closes at the very end, i.e. wraps the whole pattern.
+    parts, buf, depth, in_class, i = [], [], 0, False, 0
+    wraps = p.startswith("(")
+    while i < len(p):
+        ch = p[i]
+        if ch == "\\":
+            buf.append(p[i:i + 2])
+            i += 2
+            continue
+        if in_class:
+            in_class = ch != "]"
+        elif ch == "[":
+            in_class = True
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+            if depth == 0 and i < len(p) - 1:
+                wraps = False
+        elif ch == "|" and depth == 0:
+            parts.append("".join(buf))
+            buf = []
+            i += 1
+            continue
+        buf.append(ch)
+        i += 1
+    parts.append("".join(buf))
+    return parts, wraps
+
+def _trie_regex(words: Iterable[str]) -> str:
+    # Prefix-factored alternation: 'riot|rioting|ripple' -> 'ri(?:ot(?:ing)?|pple)'
+    trie: dict = {}
+    for w in words:
+        node = trie
+        for ch in w:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def render(node: dict) -> str:
+        alts = [re.escape(ch) + render(child) for ch, child in sorted(node.items()) if ch]
+        if not alts:
+            return ""
+        optional = "" in node
+        if len(alts) == 1 and not optional:
+            return alts[0]
+        return f"(?:{'|'.join(alts)})" + ("?" if optional else "")
+
+    return render(trie)
+
+def _factor_words(p: str) -> str:
+    # Trie-factor the literal words of a '\b(a|b|c)\b' word list; non-literal alternatives
+    # are kept verbatim, so the matched language is unchanged.
+    if not (p.startswith("\\b(") and p.endswith(")\\b")) or p.startswith("\\b(?"):
+        return p
+    alts, wraps = _scan_top_level(p[2:-2])
+    if not wraps:
+        return p
+    alts = _scan_top_level(p[3:-3])[0]
+    literals = [a for a in alts if a and not _REGEX_META.intersection(a)]
+    if len(literals) < 2:
+        return p
+    rest = [a for a in alts if a not in literals]
+    return "\\b(?:" + "|".join([_trie_regex(literals)] + rest) + ")\\b"
+
+_ESCAPE_OR_TEXT_RE = re.compile(r"\\.?|[^\\]+", re.S)
+
+def _fold_pattern(p: str) -> str:
+    # Lower-case a pattern's literal text but not its escapes: \S, \W, \D and \B
+    # would otherwise silently become their opposites
+    return "".join(m if m[0] == "\\" else m.lower() for m in _ESCAPE_OR_TEXT_RE.findall(p))
+
+def _compile(patterns: Iterable[str]) -> re.Pattern:
+    # One alternation per group: a single scan instead of a Python loop over patterns.
+    # Callers lower-case text once per item, so patterns are folded here and compiled
+    # without re.I (keeps the engine's literal fast paths; no per-char case folding).
+    return re.compile("|".join(f"(?:{_factor_words(_fold_pattern(p))})" for p in patterns))
 
 EXCL_RE = _compile(EXCLUDE_PATTERNS)
 FIN_MARKET_ONLY_RE = _compile(FIN_MARKET_ONLY)
@@ -253,8 +369,6 @@ PROTEST_SCALE_RE = _compile(PROTEST_SCALE)
 ENFORCEMENT_RE = _compile(ENFORCEMENT)
 GOV_MEASURES_RE = _compile(GOV_MEASURES)
 EVACUATION_RE = _compile(EVACUATION)
-WATCHLIST_RE = _compile(WATCHLIST)
-WATCHLIST_HUBS_RE = _compile(WATCHLIST_HUBS)
 EMEA_ALLOW_RE = _compile(EMEA_ALLOW)
 NON_EMEA_RE = _compile(NON_EMEA_BLOCK)
 US_POLITICS_RE = _compile(US_POLITICS)
@@ -262,36 +376,58 @@ US_STATES_RE = _compile(US_STATES)
 US_BIG_CITIES_RE = _compile(US_BIG_CITIES)
 URGENT_RE = _compile(URGENT_TERMS)
 
+# Fused groups for the gates that test several lists together
+NON_EMEA_ANY_RE = _compile(NON_EMEA_BLOCK + US_POLITICS + US_STATES + US_BIG_CITIES)
+HIGH_SIGNAL_RE = _compile(VIOLENCE + CASUALTIES + PROTEST_STRIKE + TRANSPORT_HARD + CYBER)
+WATCHLIST_ANY_RE = _compile(WATCHLIST + WATCHLIST_HUBS)
+
+# Quantity boosts: (pattern capturing the count, points per unit, cap)
+QTY_PATTERNS: List[Tuple[re.Pattern, int, int]] = [
+    (re.compile(r"(\d{1,3}(?:,\d{3})*)\s+(?:killed|dead|deaths|fatalities)"), 4, 80),
+    (re.compile(r"(\d{1,3}(?:,\d{3})*)\s+(?:injured|wounded|casualties)"), 2, 55),
+    (re.compile(r"(\d{1,3}(?:,\d{3})*)\s+(?:arrests?|detained|detentions?)"), 1, 45),
+]
+_DIGIT_RE = re.compile(r"\d")
+# Trusted publisher nudge; matched on the feed title, which keeps its case
+TRUSTED_SOURCE_RE = re.compile(r"BBC|Sky News|FRANCE 24|France 24|DW|Deutsche Welle|Euronews|TRT|Times of Israel|Jerusalem Post|Al Jazeera|Anadolu|Middle East Monitor|Al-Monitor", re.I)
+
 def now_ts() -> float:
     return time.time()
 
-def recency_bonus(published_ts: float) -> int:
-    hours = (now_ts() - published_ts) / 3600.0
+def recency_bonus(published_ts: float, now: Optional[float] = None) -> int:
+    # `now` lets a run score every item against one snapshot of the clock
+    hours = ((now_ts() if now is None else now) - published_ts) / 3600.0
     if hours <= 6:
         return 10
     if hours <= 24:
         return 5
     return 0
 
-# Title normalisation for de-duplication
-def normalize_title(s: str) -> str:
-    s = s or ""
-    s = s.lower()
-    s = re.sub(r"^(breaking|live|update|updated|just in|watch|video):\s+", "", s)
-    s = re.sub(r"\s*\([^)]+\)$", "", s)
-    s = re.sub(r"[-–—]+", "-", s)
-    s = re.sub(r"[^a-z0-9]+", " ", s)
-    s = re.sub(r"\b(report|video|live|analysis|opinion)\b", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+# Title normalisation for de-duplication (memoised: syndicated titles recur
+# under different links)
+_TITLE_PREFIX_RE = re.compile(r"^(breaking|live|update|updated|just in|watch|video):\s+")
+_TITLE_TRAILER_RE = re.compile(r"\s*\([^)]+\)$")
+_TITLE_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_TITLE_NOISE_WORDS = frozenset(("report", "video", "live", "analysis", "opinion"))
 
+@lru_cache(maxsize=8192)
+def normalize_title(s: str) -> str:
+    s = (s or "").lower()
+    s = _TITLE_PREFIX_RE.sub("", s)
+    s = _TITLE_TRAILER_RE.sub("", s)
+    # Alphanumeric runs joined by single spaces, minus filler words
+    return " ".join(w for w in _TITLE_TOKEN_RE.findall(s) if w not in _TITLE_NOISE_WORDS)
+
+# Predicates below expect lower-cased text (see harvest()). The pure text
+# ones are memoised: mirrored feeds carry the same wire copy many times a run
+@lru_cache(maxsize=4096)
 def is_noise(text: str) -> bool:
-    t = (text or "").lower()
+    t = text or ""
     # 1) Sports/entertainment/etc.
-    if any(rx.search(t) for rx in EXCL_RE):
+    if EXCL_RE.search(t):
         return True
     # 2) Market-movement chatter with no security relevance
-    if any(rx.search(t) for rx in FIN_MARKET_ONLY_RE) and not any(rx.search(t) for rx in FIN_SECURITY_EXC_RE):
+    if FIN_MARKET_ONLY_RE.search(t) and not FIN_SECURITY_EXC_RE.search(t):
         return True
     return False
 
@@ -299,21 +435,21 @@ def is_noise(text: str) -> bool:
 def is_emea_relevant(text: str, link: str = "") -> bool:
     t = text or ""
     # Hard block if strong non-EMEA tokens appear and no explicit EMEA/watchlist signal
-    if any(rx.search(t) for rx in (NON_EMEA_RE + US_POLITICS_RE + US_STATES_RE + US_BIG_CITIES_RE)):
-        if not (any(rx.search(t) for rx in EMEA_ALLOW_RE) or any(rx.search(t) for rx in (WATCHLIST_RE + WATCHLIST_HUBS_RE))):
+    if NON_EMEA_ANY_RE.search(t):
+        if not (EMEA_ALLOW_RE.search(t) or WATCHLIST_ANY_RE.search(t)):
             return False
 
     if not GEO_STRICT:
-        if any(rx.search(t) for rx in EMEA_ALLOW_RE):
+        if EMEA_ALLOW_RE.search(t):
             return True
-        if any(rx.search(t) for rx in NON_EMEA_RE):
+        if NON_EMEA_RE.search(t):
             return False
         return True
 
     # Strict mode: require EMEA evidence
-    if any(rx.search(t) for rx in (WATCHLIST_RE + WATCHLIST_HUBS_RE)):
+    if WATCHLIST_ANY_RE.search(t):
         return True
-    if any(rx.search(t) for rx in EMEA_ALLOW_RE):
+    if EMEA_ALLOW_RE.search(t):
         return True
     host = ""
     try:
@@ -321,45 +457,50 @@ def is_emea_relevant(text: str, link: str = "") -> bool:
     except Exception:
         pass
     if host:
-        if any(host.endswith(tld) for tld in EMEA_TLDS):
+        # Last label lookup == endswith(".tld") for any EMEA_TLDS entry
+        _, dot, label = host.rpartition(".")
+        if dot and label in EMEA_TLD_LABELS:
             return True
-        if any((host.endswith(dom) or (dom in host)) for dom in EMEA_OUTLET_DOMAINS):
+        # endswith(dom) implies dom in host
+        if any(dom in host for dom in EMEA_OUTLET_DOMAINS):
             return True
     return False
 
 def meteo_severity(text: str) -> int:
-    t = text.lower()
-    if any(rx.search(t) for rx in METEO_RED_RE):
+    t = text
+    if METEO_RED_RE.search(t):
         return 70
-    if any(rx.search(t) for rx in METEO_ORANGE_RE):
+    if METEO_ORANGE_RE.search(t):
         return 40
-    if any(rx.search(t) for rx in METEO_YELLOW_RE):
+    if METEO_YELLOW_RE.search(t):
         return 0 if REQUIRE_METEO_ORANGE else 15
     return 0
 
 def watchlist_bonus(text: str) -> int:
-    if any(rx.search(text) for rx in (WATCHLIST_RE + WATCHLIST_HUBS_RE)):
+    if WATCHLIST_ANY_RE.search(text):
         return 30
     return 0
 
+@lru_cache(maxsize=4096)
 def is_high_signal(text: str, feed_kind: str) -> bool:
     """
     Gatekeeper: only allow items that clearly represent incidents/disruption.
     """
-    t = (text or "").lower()
-    if any(rx.search(t) for rx in (VIOLENCE_RE + CASUALTIES_RE + PROTEST_RE + TRANS_HARD_RE + CYBER_RE)):
-        return True
+    t = text or ""
     # Hazards: include only if Meteoalarm orange/red or broad hazard terms
+    # (severity first for Meteoalarm: short patterns, and nearly always decisive)
     if feed_kind == "meteoalarm":
-        return meteo_severity(t) >= 40
-    if any(rx.search(t) for rx in HAZARDS_RE):
+        return meteo_severity(t) >= 40 or bool(HIGH_SIGNAL_RE.search(t))
+    if HIGH_SIGNAL_RE.search(t):
+        return True
+    if HAZARDS_RE.search(t):
         return True
     return False
 
 # ------------------------------
 # Dataclass
 # ------------------------------
-@dataclass
+@dataclass(slots=True)
 class Item:
     title: str
     link: str
@@ -374,74 +515,90 @@ class Item:
 # ------------------------------
 # Scoring model (internal-only)
 # ------------------------------
-def incident_score(text: str, feed_kind: str, published_ts: float, source: str = "") -> Tuple[int, bool]:
-    t = text.lower()
-    score = 0
-
+# Per-category weights, summed once per matching category
+_SCORER: List[Tuple[re.Pattern, int]] = [
     # Violence / terror
-    if any(rx.search(t) for rx in TERROR_RE):
-        score += 90
-    if any(rx.search(t) for rx in VIOLENCE_RE):
-        score += 85
-    if any(rx.search(t) for rx in CASUALTIES_RE):
-        score += 35
-
+    (TERROR_RE, 90),
+    (VIOLENCE_RE, 85),
+    (CASUALTIES_RE, 35),
     # Protests & policing / govt measures / evacuations (boosted)
-    if any(rx.search(t) for rx in PROTEST_RE):
-        score += 55
-    if any(rx.search(t) for rx in PROTEST_SCALE_RE):
-        score += 35
-    if any(rx.search(t) for rx in ENFORCEMENT_RE):
-        score += 30
-    if any(rx.search(t) for rx in GOV_MEASURES_RE):
-        score += 40
-    if any(rx.search(t) for rx in EVACUATION_RE):
-        score += 50
-
+    (PROTEST_RE, 55),
+    (PROTEST_SCALE_RE, 35),
+    (ENFORCEMENT_RE, 30),
+    (GOV_MEASURES_RE, 40),
+    (EVACUATION_RE, 50),
     # Transport
-    if any(rx.search(t) for rx in TRANS_HARD_RE):
-        score += 70
-    if any(rx.search(t) for rx in TRANS_SOFT_RE):
-        score += 25
-
+    (TRANS_HARD_RE, 70),
+    (TRANS_SOFT_RE, 25),
     # Cyber
-    if any(rx.search(t) for rx in CYBER_RE):
-        score += 50
+    (CYBER_RE, 50),
+]
+
+def base_score(text: str, feed_kind: str, source: str = "") -> Optional[Tuple[int, bool]]:
+    """
+    Time-independent part of incident_score: (score, urgent term seen), or
+    None when the item is dropped outright (yellow-only Meteoalarm).
+    """
+    t = text  # already lower-cased by the caller
+    score = 0
+    for rx, weight in _SCORER:
+        if rx.search(t):
+            score += weight
 
     # Weather / hazards
     met_sev = meteo_severity(t)
     if feed_kind == "meteoalarm" and met_sev < 40 and REQUIRE_METEO_ORANGE:
-        return 0, False  # drop yellow-only meteoalarm
-    if feed_kind == "meteoalarm" or any(rx.search(t) for rx in HAZARDS_RE):
+        return None  # drop yellow-only meteoalarm
+    if feed_kind == "meteoalarm" or HAZARDS_RE.search(t):
         score += met_sev
-        if re.search(r"flood|earthquake|aftershock", t):
+        if "flood" in t or "earthquake" in t or "aftershock" in t:
             score += 20
 
-    # Quantity boosts
-    for rx, mult, cap in [
-        (re.compile(r"(\d{1,3}(?:,\d{3})*)\s+(?:killed|dead|deaths|fatalities)", re.I), 4, 80),
-        (re.compile(r"(\d{1,3}(?:,\d{3})*)\s+(?:injured|wounded|casualties)", re.I), 2, 55),
-        (re.compile(r"(\d{1,3}(?:,\d{3})*)\s+(?:arrests?|detained|detentions?)", re.I), 1, 45),
-    ]:
-        for m in rx.finditer(t):
-            try:
-                n = int(m.group(1).replace(",", ""))
-                score += min(cap, max(5, n * mult))
-            except Exception:
-                pass
+    # Quantity boosts; every pattern needs a digit, and most texts have none
+    if _DIGIT_RE.search(t):
+        for rx, mult, cap in QTY_PATTERNS:
+            for m in rx.finditer(t):
+                try:
+                    n = int(m.group(1).replace(",", ""))
+                    score += min(cap, max(5, n * mult))
+                except Exception:
+                    pass
 
-    # Watchlist & recency
+    # Watchlist
     score += watchlist_bonus(t)
-    score += recency_bonus(published_ts)
 
     # Trusted publisher nudge (EMEA-centric)
-    if source and re.search(r"BBC|Sky News|FRANCE 24|France 24|DW|Deutsche Welle|Euronews|TRT|Times of Israel|Jerusalem Post|Al Jazeera|Anadolu|Middle East Monitor|Al-Monitor", source, re.I):
+    if source and TRUSTED_SOURCE_RE.search(source):
         score += 8
 
+    return score, bool(URGENT_RE.search(t))
+
+def classify(text: str, link: str, feed_kind: str, source: str = "") -> Optional[Tuple[int, bool]]:
+    """
+    All text-derived decisions for a feed entry: base_score() if it passes the
+    noise, EMEA and high-signal gates, else None.
+    """
+    if feed_kind == "meteoalarm" and REQUIRE_METEO_ORANGE and meteo_severity(text) < 40:
+        return None  # yellow-only: base_score() drops it anyway, so skip every other scan
+    # Gates are independent rejections, so run them cheapest and most selective
+    # first: one fused signal scan turns away most news before the larger
+    # noise and geography pattern sets are scanned
+    if not is_high_signal(text, feed_kind) or is_noise(text) or not is_emea_relevant(text, link):
+        return None
+    return base_score(text, feed_kind, source)
+
+def with_recency(base: Tuple[int, bool], published_ts: float, now: Optional[float] = None) -> Tuple[int, bool]:
+    score = base[0] + recency_bonus(published_ts, now)
     # Urgent override
-    urgent = any(rx.search(t) for rx in URGENT_RE) or score >= (P1_THRESHOLD + 10)
+    urgent = base[1] or score >= (P1_THRESHOLD + 10)
     return score, urgent
 
+def incident_score(text: str, feed_kind: str, published_ts: float, source: str = "", now: Optional[float] = None) -> Tuple[int, bool]:
+    base = base_score(text, feed_kind, source)
+    if base is None:
+        return 0, False
+    return with_recency(base, published_ts, now)
+
 def to_priority(score: int) -> int:
     if score >= P1_THRESHOLD:
         return 1
@@ -454,48 +611,274 @@ def to_priority(score: int) -> int:
 # ------------------------------
 # Harvest & build
 # ------------------------------
-def pub_ts(entry) -> float:
+def pub_ts(entry, now: Optional[float] = None) -> float:
     for key in ("published_parsed", "updated_parsed"):
         v = entry.get(key)
         if v:
             try:
-                return time.mktime(v)
+                return calendar.timegm(v)  # struct_time is UTC; mktime would assume local
             except Exception:
                 pass
-    return now_ts()
+    return now_ts() if now is None else now
 
-def harvest() -> List[Item]:
-    items: List[Item] = []
-    for feed_kind, url in ALL_FEEDS:
+def load_json_cache(path: str) -> dict:
+    if not path:
+        return {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            cache = json.load(f)
+    except Exception:
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+def save_json_cache(path: str, cache: dict) -> None:
+    if not path:
+        return
+    tmp = f"{path}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp, path)
+    except Exception:
+        pass
+
+def _rules_digest() -> str:
+    # Any edit to this file (patterns, weights, gates) invalidates cached verdicts
+    try:
+        with open(__file__, "rb") as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except OSError:
+        return ""
+
+def _cache_entry(e: dict) -> dict:
+    # struct_time is stored as a plain list
+    parsed = e.get("published_parsed")
+    return {**e, "published_parsed": list(parsed) if parsed else None}
+
+def _cached_entry(c: dict) -> dict:
+    parsed = c.get("published_parsed")
+    return {**c, "published_parsed": time.struct_time(parsed) if parsed else None}
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_RSS1 = "{http://purl.org/rss/1.0/}"
+_RDF_ROOT = "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}RDF"
+_DC = "{http://purl.org/dc/elements/1.1/}"
+_CONTENT_ENCODED = "{http://purl.org/rss/1.0/modules/content/}encoded"
+
+_ITEM_TAGS = {"item", _RSS1 + "item", _ATOM + "entry"}
+_TITLE_TAGS = {"title", _RSS1 + "title", _ATOM + "title"}
+_SUMMARY_TAGS = {"description", _RSS1 + "description", _ATOM + "summary"}
+_CONTENT_TAGS = {_CONTENT_ENCODED, _ATOM + "content"}
+_PUBLISHED_TAGS = {"pubDate", _ATOM + "published", "{http://purl.org/dc/terms/}issued"}
+_UPDATED_TAGS = {_DC + "date", _ATOM + "updated"}
+
+def _entry(e) -> dict:
+    # Same fields harvest() reads from feedparser entries; dates are UTC struct_time
+    return {
+        "title": e.get("title") or "",
+        "link": e.get("link") or "",
+        "summary": e.get("summary") or e.get("description") or "",
+        "published_parsed": e.get("published_parsed") or e.get("updated_parsed"),
+    }
+
+def _parse_date(value: str):
+    # An unparseable or out-of-range date leaves only this entry undated, as
+    # feedparser did; it must not escape and drop the whole feed
+    value = value.strip()
+    try:
         try:
-            fp = feedparser.parse(url)
-        except Exception:
-            continue
-        source_name = fp.feed.get("title") or url
-        for e in fp.entries:
+            dt = email.utils.parsedate_to_datetime(value)  # RFC 822 (RSS)
+        except (TypeError, ValueError):
+            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))  # ISO 8601 (Atom, dc:date)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.utctimetuple()
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+def _text(el) -> str:
+    if el.get("type") == "xhtml":
+        return "".join(el.itertext())
+    if len(el):
+        # Unescaped child markup in a well-formed feed: keep all of it, as
+        # feedparser did (tostring() carries each child's tail text)
+        return (el.text or "") + "".join(ET.tostring(child, encoding="unicode") for child in el)
+    return el.text or ""
+
+def _xml_entry(item) -> dict:
+    title = link = summary = content = published = updated = guid = ""
+    for child in item:
+        tag = child.tag
+        if tag in _TITLE_TAGS:
+            title = title or _text(child)
+        elif tag in ("link", _RSS1 + "link"):
+            link = link or (child.text or "").strip()
+        elif tag == _ATOM + "link":
+            if not link and child.get("rel", "alternate") == "alternate":
+                link = child.get("href") or ""
+        elif tag in _SUMMARY_TAGS:
+            summary = summary or _text(child)
+        elif tag in _CONTENT_TAGS:
+            content = content or _text(child)
+        elif tag in _PUBLISHED_TAGS:
+            published = published or (child.text or "")
+        elif tag in _UPDATED_TAGS:
+            updated = updated or (child.text or "")
+        elif tag == "guid" and child.get("isPermaLink", "true") != "false":
+            guid = (child.text or "").strip()
+    parsed = None
+    for value in (published, updated):
+        if value and parsed is None:
+            parsed = _parse_date(value)
+    return {
+        "title": title,
+        "link": link or guid,
+        "summary": summary or content,  # feedparser also falls back to full content
+        "published_parsed": parsed,
+    }
+
+def parse_feed_xml(raw: bytes) -> Optional[Tuple[str, List[dict]]]:
+    # Streams (feed title, entries) out of RSS 2.0 / RSS 1.0 / Atom 1.0, clearing
+    # each item once read. None means "not something we parse; use feedparser".
+    feed_title = ""
+    entries: List[dict] = []
+    path: List[str] = []
+    try:
+        for event, el in ET.iterparse(io.BytesIO(raw), events=("start", "end")):
+            if event == "start":
+                if not path and el.tag not in ("rss", _RDF_ROOT, _ATOM + "feed"):
+                    return None
+                path.append(el.tag)
+                continue
+            path.pop()
+            if el.tag in _ITEM_TAGS:
+                entries.append(_xml_entry(el))
+                el.clear()
+            elif el.tag in _TITLE_TAGS and not feed_title and path and path[-1] in ("channel", _RSS1 + "channel", _ATOM + "feed"):
+                feed_title = _text(el).strip()
+    except ET.ParseError:
+        return None
+    return feed_title, entries
+
+def publishable_html(summary: str) -> str:
+    # Summaries are scanned raw but republished as HTML in <description>: run
+    # feedparser's sanitiser (drops script/iframe, on* handlers, javascript:
+    # URLs) on the part that is published, once per kept item
+    return _sanitize_html(summary[:MAX_DESCRIPTION_CHARS], "utf-8", "text/html")
+
+def pull_feed(url: str, etag: Optional[str] = None, modified: Optional[str] = None) -> Optional[dict]:
+    headers = {"User-Agent": FETCH_USER_AGENT, "Accept-Encoding": "gzip"}
+    if etag:
+        headers["If-None-Match"] = etag
+    if modified:
+        headers["If-Modified-Since"] = modified
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=FETCH_TIMEOUT) as resp:
+            raw = resp.read(MAX_FEED_BYTES)
+            resp_headers = resp.headers
+    except urllib.error.HTTPError as err:
+        return {"status": 304} if err.code == 304 else None
+    except Exception:
+        return None
+    # A body cut at the cap parses (leniently) to a partial entry list: return no
+    # validators then, so it is never cached and replayed on later 304s
+    truncated = len(raw) >= MAX_FEED_BYTES
+    try:
+        if (resp_headers.get("Content-Encoding") or "").lower() == "gzip":
+            with gzip.GzipFile(fileobj=io.BytesIO(raw)) as gz:
+                raw = gz.read(MAX_FEED_BYTES)
+            truncated = truncated or len(raw) >= MAX_FEED_BYTES
+        result = parse_feed_xml(raw)
+        if result is not None:
+            feed_title, entries = result
+        else:
+            # Same raw-text contract as the stream parser: scoring sees the feed's own
+            # text, and publishable_html() sanitises what is republished on both paths
+            fp = feedparser.parse(
+                raw,
+                response_headers={k.lower(): v for k, v in resp_headers.items()},
+                sanitize_html=False,
+                resolve_relative_uris=False,
+            )
+            feed_title, entries = fp.feed.get("title") or "", [_entry(e) for e in fp.entries]
+    except Exception:
+        return None
+    return {
+        "status": 200,
+        "etag": None if truncated else resp_headers.get("ETag"),
+        "modified": None if truncated else resp_headers.get("Last-Modified"),
+        "title": feed_title,
+        "entries": entries,
+    }
+
+def _ranked(items: List[Item]):
+    # Lazy equivalent of sorted(key=(priority, score, published_ts), reverse=True):
+    # heapify is O(N) and each pop O(log N), so callers that stop after K items
+    # never pay for a full sort. The index keeps ties in input order, as the
+    # stable sort did.
+    heap = [(-it.priority, -it.score, -it.published_ts, i, it) for i, it in enumerate(items)]
+    heapq.heapify(heap)
+    while heap:
+        yield heapq.heappop(heap)[-1]
+
+def harvest(cache_path: str = "", max_items: int = 0, score_cache_path: str = "") -> List[Item]:
+    items: List[Item] = []
+    cache = load_json_cache(cache_path)
+    fresh_cache: dict = {}
+    rules = _rules_digest()
+    score_cache = load_json_cache(score_cache_path)
+    verdicts = (score_cache.get("verdicts") or {}) if rules and score_cache.get("rules") == rules else {}
+    fresh_verdicts: dict = {}
+
+    def _pull(url: str):
+        meta = cache.get(url) or {}
+        return pull_feed(url, meta.get("etag"), meta.get("modified"))
+
+    def _process_feed(feed_kind: str, url: str, fp: dict, now: float) -> List[Item]:
+        if fp.get("status") == 304 and url in cache:
+            # Not modified: replay the entries stored with the validators
+            meta = cache[url]
+            fresh_cache[url] = meta
+            source_name = meta.get("title") or url
+            entries = [_cached_entry(c) for c in meta.get("entries") or []]
+        else:
+            source_name = fp["title"] or url
+            entries = fp["entries"]
+            if fp.get("etag") or fp.get("modified"):
+                fresh_cache[url] = {
+                    "etag": fp.get("etag"),
+                    "modified": fp.get("modified"),
+                    "title": fp["title"],
+                    "entries": [_cache_entry(e) for e in entries],
+                }
+        out: List[Item] = []
+        for e in entries:
             title = (e.get("title") or "").strip()
             link = (e.get("link") or "").strip()
             if not title or not link:
                 continue
-            summary = html.unescape((e.get("summary") or e.get("description") or "").strip())
-            joined = f"{title} {summary}"
-
-            if is_noise(joined):
+            # Excluded topic in the title alone: is_noise() would reject the joined
+            # text too, so skip unescaping and hashing the summary
+            if EXCL_RE.search(title.lower()):
                 continue
-            if not is_emea_relevant(joined, link):
-                continue
-            if not is_high_signal(joined, feed_kind):
+            summary = html.unescape(e["summary"].strip())
+            joined = f"{title} {summary}".lower()
+
+            key = hashlib.sha1(f"{feed_kind}|{source_name}|{link}|{joined}".encode("utf-8")).hexdigest()
+            base = verdicts[key] if key in verdicts else classify(joined, link, feed_kind, source_name)
+            fresh_verdicts[key] = base
+            if base is None:
                 continue
 
-            ts = pub_ts(e)
-            score, urgent = incident_score(joined, feed_kind, ts, source_name)
+            ts = pub_ts(e, now)
+            score, urgent = with_recency(base, ts, now)
             prio = to_priority(score)
             if prio == 0 or score < MIN_SCORE_TO_INCLUDE:
                 continue
-            items.append(Item(
+            out.append(Item(
                 title=html.unescape(title),
                 link=link,
-                summary=summary,
+                summary=publishable_html(summary),
                 published_ts=ts,
                 source=source_name,
                 feed_kind=feed_kind,
@@ -503,65 +886,129 @@ def harvest() -> List[Item]:
                 priority=prio,
                 urgent=urgent,
             ))
+        return out
+
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        # Israel HFC (rocket sirens) is fetched alongside the feeds
+        oref = pool.submit(harvest_oref)
+        parsed = list(pool.map(_pull, [url for _kind, url in ALL_FEEDS]))
+        oref_items = oref.result()
+
+    now = now_ts()  # one clock reading for the whole scoring pass
+    for (feed_kind, url), fp in zip(ALL_FEEDS, parsed):
+        if fp is not None:
+            items.extend(_process_feed(feed_kind, url, fp, now))
 
-    # Israel HFC (rocket sirens)
-    items.extend(harvest_oref())
+    save_json_cache(cache_path, fresh_cache)
+    save_json_cache(score_cache_path, {"rules": rules, "verdicts": fresh_verdicts})
+
+    items.extend(oref_items)
 
     # Deduplicate & sort
-    seen_hashes = set()
-    seen_norm_titles: List[str] = []
+    # In-process exact-dup key: the (title, link) tuple itself; SHA-256 is only
+    # needed for the stable public GUID in build_feed()
+    seen_keys = set()
+    seen_norm_titles = set()
+    # Kept titles by length. ratio() = 2*matches/(la+lb) <= 2*min(la,lb)/(la+lb),
+    # so only lengths inside [la*r/(2-r), la*(2-r)/r] can reach TITLE_DUP_RATIO
+    # Each kept title holds a matcher with it as seq2, so its b2j index is
+    # built once rather than on every comparison
+    seen_by_len: Dict[int, List[SequenceMatcher]] = {}
+    lo_factor = TITLE_DUP_RATIO / (2 - TITLE_DUP_RATIO)
     out: List[Item] = []
-    for it in sorted(items, key=lambda x: (x.priority, x.score, x.published_ts), reverse=True):
-        h = hashlib.sha256((it.title + '|' + it.link).encode('utf-8')).hexdigest()
-        if h in seen_hashes:
+    for it in _ranked(items):
+        key = (it.title, it.link)
+        if key in seen_keys:
             continue
         norm = normalize_title(it.title)
         dup = False
         if norm in seen_norm_titles:
             dup = True
         else:
-            for prev in seen_norm_titles:
-                if SequenceMatcher(None, norm, prev).ratio() >= 0.96:
-                    dup = True
+            n = len(norm)
+            for length in range(math.floor(n * lo_factor), math.ceil(n / lo_factor) + 1):
+                for sm in seen_by_len.get(length, ()):
+                    sm.set_seq1(norm)
+                    # Cheaper upper bounds first; ratio() only when both pass
+                    if (sm.real_quick_ratio() >= TITLE_DUP_RATIO
+                            and sm.quick_ratio() >= TITLE_DUP_RATIO
+                            and sm.ratio() >= TITLE_DUP_RATIO):
+                        dup = True
+                        break
+                if dup:
                     break
         if dup:
             continue
-        seen_hashes.add(h)
-        seen_norm_titles.append(norm)
+        seen_keys.add(key)
+        seen_norm_titles.add(norm)
+        seen_by_len.setdefault(len(norm), []).append(SequenceMatcher(None, b=norm))
         out.append(it)
+        if max_items and len(out) >= max_items:
+            break
     return out
 
-def build_feed(items: List[Item], title: str, homepage: str, replay: int = 0, reseed: str = "") -> str:
-    fg = FeedGenerator()
-    fg.title(title)
-    fg.link(href=homepage, rel="alternate")
-    fg.description("Merged & filtered EMEA alerts (internal scoring, clean titles)")
-    fg.language("en")
-    now = datetime.now(timezone.utc)
-    fg.updated(now)
+_XML_ILLEGAL_RE = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f\ufffe\uffff]")
 
-    for idx, it in enumerate(items):
+def _xml_text(s: str) -> str:
+    # Text-node escaping as lxml/feedgen wrote it (quotes kept, CR as a char
+    # ref); XML-illegal control characters are dropped rather than fatal
+    return xml_escape(_XML_ILLEGAL_RE.sub("", s), {"\r": "&#13;"})
+
+def iter_feed(items: List[Item], title: str, homepage: str, replay: int = 0, reseed: str = "") -> Iterator[str]:
+    # RSS 2.0 written directly, one chunk per item; same layout feedgen's
+    # rss_str(pretty=True) gave
+    now = datetime.now(timezone.utc)
+    yield (
+        "<?xml version='1.0' encoding='UTF-8'?>\n"
+        '<rss xmlns:atom="http://www.w3.org/2005/Atom" xmlns:content="http://purl.org/rss/1.0/modules/content/" version="2.0">\n'
+        "  <channel>\n"
+        f"    <title>{_xml_text(title)}</title>\n"
+        f"    <link>{_xml_text(homepage)}</link>\n"
+        "    <description>Merged &amp; filtered EMEA alerts (internal scoring, clean titles)</description>\n"
+        "    <docs>http://www.rssboard.org/rss-specification</docs>\n"
+        "    <generator>emea_feed_relay</generator>\n"
+        "    <language>en</language>\n"
+        f"    <lastBuildDate>{email.utils.format_datetime(now)}</lastBuildDate>\n"
+    )
+
+    prefixes: Dict[str, str] = {}  # source -> escaped description prefix
+    # Replay GUID suffix is the same for every item of a run
+    seed_suffix = ("|" + (reseed or now.strftime("%Y%m%d%H%M%S"))).encode("utf-8")
+    # feedgen prepended every entry; keep that order so the published feed is unchanged
+    for idx in range(len(items) - 1, -1, -1):
+        it = items[idx]
         if it.priority not in (1, 2, 3):
             continue
-        fe = fg.add_entry()
-        fe.title(it.title)  # public: clean title only
-        fe.link(href=it.link)
-        desc = it.summary
-        if it.source:
-            desc = f"<b>Source:</b> {html.escape(it.source)}<br/>" + desc
-        fe.description(desc[:2000])
+        prefix = prefixes.get(it.source)
+        if prefix is None:
+            prefix = prefixes[it.source] = f"<b>Source:</b> {html.escape(it.source)}<br/>" if it.source else ""
+        # Same as (prefix + summary)[:MAX_DESCRIPTION_CHARS] without building the untruncated string
+        desc = prefix[:MAX_DESCRIPTION_CHARS] + it.summary[:max(0, MAX_DESCRIPTION_CHARS - len(prefix))]
+        # sha256 of "title|link" (plus "|seed" on replay), fed in parts so
+        # no joined str is built and re-encoded per item
+        h = hashlib.sha256(it.title.encode("utf-8"))
+        h.update(b"|")
+        h.update(it.link.encode("utf-8"))
         if idx < replay:
-            bumped = now + timedelta(seconds=(replay - idx))
-            fe.pubDate(bumped)
-            seed = reseed or now.strftime("%Y%m%d%H%M%S")
-            guid = hashlib.sha256((it.title + '|' + it.link + '|' + seed).encode("utf-8")).hexdigest()
-            fe.guid(guid, permalink=False)
+            published = now + timedelta(seconds=(replay - idx))
+            h.update(seed_suffix)
         else:
-            fe.pubDate(datetime.fromtimestamp(it.published_ts, tz=timezone.utc))
-            guid = hashlib.sha256((it.title + '|' + it.link).encode("utf-8")).hexdigest()
-            fe.guid(guid, permalink=False)
+            published = datetime.fromtimestamp(it.published_ts, tz=timezone.utc)
+        guid = h.hexdigest()
+        yield (
+            "    <item>\n"
+            f"      <title>{_xml_text(it.title)}</title>\n"  # public: clean title only
+            f"      <link>{_xml_text(it.link)}</link>\n"
+            + (f"      <description>{_xml_text(desc)}</description>\n" if desc else "")
+            + f'      <guid isPermaLink="false">{guid}</guid>\n'
+            f"      <pubDate>{email.utils.format_datetime(published)}</pubDate>\n"
+            "    </item>\n"
+        )
+
+    yield "  </channel>\n</rss>\n"
 
-    return fg.rss_str(pretty=True).decode("utf-8")
+def build_feed(items: List[Item], title: str, homepage: str, replay: int = 0, reseed: str = "") -> str:
+    return "".join(iter_feed(items, title, homepage, replay, reseed))
 
 # ------------------------------
 # Israel Home Front Command (Oref)
@@ -577,31 +1024,37 @@ def harvest_oref() -> List[Item]:
         "Accept": "application/json, text/plain, */*",
     }
     results: List[Item] = []
+    now_s = datetime.now(timezone.utc).timestamp()
+
+    def _mk_item(title: str, link_text: str, when: float, details: str) -> Item:
+        text = f"{title} {details}".lower()
+        score, _urgent = incident_score(text, "alerts", when, "Israel HFC", now_s)
+        score = max(score, P1_THRESHOLD + 5)  # force P1
+        return Item(
+            title=title,
+            link=link_text,
+            summary=details,
+            published_ts=when,
+            source="Israel Home Front Command (Oref)",
+            feed_kind="alerts",
+            score=score,
+            priority=to_priority(score),
+            urgent=True,
+        )
+
     for url in url_candidates:
         try:
             req = urllib.request.Request(url, headers=headers)
-            raw = urllib.request.urlopen(req, timeout=10).read()
+            raw = urllib.request.urlopen(req, timeout=FETCH_TIMEOUT).read()
+            # An idle endpoint answers with an empty (or BOM-only) body: that is
+            # "no alerts", not a reason to hit the other spelling of the URL
+            body = raw.decode("utf-8-sig", "ignore").strip()
+            if not body:
+                break
             try:
-                js = json.loads(raw.decode("utf-8", "ignore"))
+                js = json.loads(body)
             except Exception:
                 continue
-            now = datetime.now(timezone.utc)
-
-            def _mk_item(title: str, link_text: str, when: float, details: str) -> Item:
-                text = f"{title} {details}"
-                score, _urgent = incident_score(text, "alerts", when, "Israel HFC")
-                score = max(score, P1_THRESHOLD + 5)  # force P1
-                return Item(
-                    title=title,
-                    link=link_text,
-                    summary=details,
-                    published_ts=when,
-                    source="Israel Home Front Command (Oref)",
-                    feed_kind="alerts",
-                    score=score,
-                    priority=to_priority(score),
-                    urgent=True,
-                )
 
             # Handle common response shapes
             if isinstance(js, dict) and js.get("data"):
@@ -616,15 +1069,15 @@ def harvest_oref() -> List[Item]:
                 threat = entry.get("title") or entry.get("category") or "Rocket alert"
                 ts_str = entry.get("time") or entry.get("alertDate") or entry.get("date")
                 try:
-                    when = datetime.fromisoformat(str(ts_str).replace("Z", "+00:00")).timestamp() if ts_str else now.timestamp()
+                    when = datetime.fromisoformat(str(ts_str).replace("Z", "+00:00")).timestamp() if ts_str else now_s
                 except Exception:
-                    when = now.timestamp()
+                    when = now_s
                 cities_txt = ", ".join(cities) if isinstance(cities, list) else str(cities)
                 details = f"Threat: {threat}; Areas: {cities_txt}"
                 results.append(_mk_item(title=f"Rocket siren: {cities_txt or threat}", link_text=url, when=when, details=details))
 
-            if results:
-                break
+            # Valid JSON is authoritative whether or not it lists alerts
+            break
         except Exception:
             continue
     return results
@@ -643,15 +1096,19 @@ def main():
     ap.add_argument("--force", action="store_true", help="Ignored in v2")
     ap.add_argument("--replay", type=int, default=0, help="Backfill: treat newest N items as fresh")
     ap.add_argument("--reseed", default="", help="GUID reseed token for --replay")
+    ap.add_argument("--feed-cache", default=FEED_CACHE_PATH, help="ETag/Last-Modified cache file ('' disables)")
+    ap.add_argument("--score-cache", default=SCORE_CACHE_PATH, help="Per-entry verdict cache file ('' disables)")
     args = ap.parse_args()
 
-    items = harvest()
+    items = harvest(cache_path=args.feed_cache, max_items=args.max_items, score_cache_path=args.score_cache)
     items = items[: args.max_items]
 
     os.makedirs(os.path.dirname(args.output), exist_ok=True)
-    xml = build_feed(items, title=args.title, homepage=args.homepage, replay=args.replay, reseed=args.reseed)
-    with open(args.output, "w", encoding="utf-8") as f:
-        f.write(xml)
+    # Streamed to a temp file and swapped in, so readers never see a partial feed
+    tmp = f"{args.output}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.writelines(iter_feed(items, title=args.title, homepage=args.homepage, replay=args.replay, reseed=args.reseed))
+    os.replace(tmp, args.output)
     print(f"Wrote {args.output} with {len(items)} items")
 
 if __name__ == "__main__":
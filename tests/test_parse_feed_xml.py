@@ -0,0 +1,39 @@
+import os
+import unittest
+
+import feedparser
+
+import emea_feed_relay as relay
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "mixed_content.xml")
+
+
+class ParseFeedXmlTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with open(FIXTURE, "rb") as fh:
+            cls.raw = fh.read()
+        cls.title, cls.entries = relay.parse_feed_xml(cls.raw)
+
+    def test_matches_feedparser_text(self):
+        # Titles and summaries, child markup included, come out as feedparser gave them
+        fp = feedparser.parse(self.raw, sanitize_html=False, resolve_relative_uris=False)
+        self.assertEqual(self.title, fp.feed.title)
+        expected = [relay._entry(e) for e in fp.entries]
+        self.assertEqual(
+            [(e["title"], e["link"], e["summary"]) for e in self.entries],
+            [(e["title"], e["link"], e["summary"]) for e in expected],
+        )
+
+    def test_child_markup_is_not_truncated(self):
+        self.assertEqual(self.entries[0]["title"], "Paris protest: police use <b>tear gas</b> near the Louvre")
+        self.assertEqual(self.entries[0]["summary"], "Police fired <b>tear gas</b> as 40 people were detained in Paris, France")
+
+    def test_out_of_range_date_leaves_only_that_entry_undated(self):
+        self.assertEqual(len(self.entries), 3)
+        self.assertIsNotNone(self.entries[0]["published_parsed"])
+        self.assertIsNone(self.entries[2]["published_parsed"])
+
+
+if __name__ == "__main__":
+    unittest.main()